@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    NUMBA_DISPONIVEL = True
+except ImportError:
+    NUMBA_DISPONIVEL = False
+
+    def njit(*args, **kwargs):
+        """Substituto sem efeito para ``numba.njit`` quando o Numba não está instalado."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True, error_model="numpy")
+def estatisticas_retornos(close: np.ndarray) -> Tuple[float, float, float]:
+    """Calcula média, desvio padrão amostral e máximo drawdown dos retornos diários.
+
+    Percorre os fechamentos uma única vez, usando o algoritmo de Welford para a variância.
+    Espera-se um array ``float64`` de fechamentos sem ``NaN``.
+    """
+    n = close.shape[0] - 1
+    if n < 1:
+        return np.nan, np.nan, np.nan
+
+    media = 0.0
+    m2 = 0.0
+    pico = -np.inf
+    maximo_drawdown = 0.0
+    for i in range(1, close.shape[0]):
+        retorno = close[i] / close[i - 1] - 1.0
+        delta = retorno - media
+        media += delta / i
+        m2 += delta * (retorno - media)
+
+        crescimento = close[i] / close[0]
+        # NaN se propaga como em ``np.maximum.accumulate`` e ``min`` no caminho NumPy.
+        if crescimento > pico or crescimento != crescimento:
+            pico = crescimento
+        drawdown = crescimento / pico - 1.0
+        if drawdown < maximo_drawdown or drawdown != drawdown:
+            maximo_drawdown = drawdown
+
+    if n < 2:
+        return media, np.nan, maximo_drawdown
+    return media, (m2 / (n - 1)) ** 0.5, maximo_drawdown
+
+
+if NUMBA_DISPONIVEL:
+    # Compila (ou carrega do cache em disco) na importação, antes do primeiro acesso de um usuário.
+    estatisticas_retornos(np.ones(3, dtype=np.float64))
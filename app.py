@@ -1,54 +1,26 @@
 from __future__ import annotations
 
 from pathlib import Path
-import importlib.util
+import sys
 
 import streamlit as st
 
 
 BASE_DIR = Path(__file__).resolve().parent
-
-
-def _load_local_module(module_name: str):
-    """Carrega um módulo local de forma resiliente em ambientes com hot-reload."""
-    module_path = BASE_DIR / f"{module_name}.py"
-    spec = importlib.util.spec_from_file_location(f"local_{module_name}", module_path)
-    if spec is None or spec.loader is None:
-        raise ModuleNotFoundError(f"Não foi possível localizar o módulo '{module_name}'.")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-try:
-    from data_provider import get_data
-except (KeyError, ModuleNotFoundError):
-    get_data = _load_local_module("data_provider").get_data
-
-try:
-    from layout import (
-        apply_custom_style,
-        build_price_chart,
-        build_volume_chart,
-        render_friendly_error,
-        render_header,
-        render_kpis,
-        render_sidebar,
-    )
-except (KeyError, ModuleNotFoundError):
-    layout_module = _load_local_module("layout")
-    apply_custom_style = layout_module.apply_custom_style
-    build_price_chart = layout_module.build_price_chart
-    build_volume_chart = layout_module.build_volume_chart
-    render_friendly_error = layout_module.render_friendly_error
-    render_header = layout_module.render_header
-    render_kpis = layout_module.render_kpis
-    render_sidebar = layout_module.render_sidebar
-
-try:
-    from metrics import calculate_metrics
-except (KeyError, ModuleNotFoundError):
-    calculate_metrics = _load_local_module("metrics").calculate_metrics
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+
+from data_provider import get_data
+from layout import (
+    apply_custom_style,
+    build_price_chart,
+    build_volume_chart,
+    render_friendly_error,
+    render_header,
+    render_kpis,
+    render_sidebar,
+)
+from metrics import calculate_metrics
 
 
 st.set_page_config(layout="wide", page_title="Panorama Investidor", page_icon="📈")
@@ -75,10 +47,11 @@ def main() -> None:
     metrics = calculate_metrics(history)
     render_kpis(metrics)
 
-    st.plotly_chart(build_price_chart(history, ticker), use_container_width=True)
+    st.plotly_chart(build_price_chart(history, ticker, period), use_container_width=True)
 
     if "Volume" in history.columns and history["Volume"].notna().any():
-        st.plotly_chart(build_volume_chart(history), use_container_width=True)
+        with st.expander("Volume diário", expanded=False):
+            st.plotly_chart(build_volume_chart(history), use_container_width=True)
 
 
 if __name__ == "__main__":
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 import pandas as pd
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 ALPHA_VANTAGE_URL = "https://www.alphavantage.co/query"
 API_KEY = os.getenv("ALPHA_VANTAGE_KEY")
 
+# Cache em disco das séries já processadas, compartilhado entre reinícios do app.
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+DISK_CACHE_TTL_SECONDS = 3600
+
+# Campos da série diária ajustada que o app utiliza, com os nomes de coluna adotados.
+_ALPHA_VANTAGE_COLUMNS = {
+    "5. adjusted close": "Close",
+    "6. volume": "Volume",
+}
+
+_INT32_MAX = 2**31 - 1
+
 _PERIOD_TO_DAYS = {
     "1m": 31,
     "6m": 186,
@@ -22,6 +41,46 @@ class DataProviderError(Exception):
     """Mantida por compatibilidade, mas get_data não propaga exceções."""
 
 
+@st.cache_resource(show_spinner=False)
+def _http_session() -> requests.Session:
+    """Sessão HTTP compartilhada para reaproveitar conexões TLS com a Alpha Vantage."""
+    retry = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return session
+
+
+def _disk_cache_path(symbol: str, outputsize: str) -> Path:
+    key = hashlib.sha1(f"{symbol}|{outputsize}".encode("utf-8")).hexdigest()
+    return CACHE_DIR / f"{key}.parquet"
+
+
+def _read_disk_cache(path: Path) -> Optional[pd.DataFrame]:
+    """Lê a série do cache em disco, ignorando arquivos expirados ou corrompidos."""
+    try:
+        if time.time() - path.stat().st_mtime > DISK_CACHE_TTL_SECONDS:
+            return None
+        return pd.read_parquet(path, engine="pyarrow")
+    except Exception:
+        return None
+
+
+def _write_disk_cache(path: Path, df: pd.DataFrame) -> None:
+    """Grava a série de forma atômica; falhas de escrita apenas desativam o cache."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        try:
+            df.to_parquet(tmp_path, engine="pyarrow", compression="zstd")
+            tmp_path.replace(path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
 def _parse_alpha_vantage_series(payload: dict) -> Optional[pd.DataFrame]:
     if "Note" in payload:
         st.warning(
@@ -37,24 +96,28 @@ def _parse_alpha_vantage_series(payload: dict) -> Optional[pd.DataFrame]:
     if not isinstance(series, dict) or not series:
         return None
 
-    rows = []
-    for date_str, values in series.items():
-        rows.append(
-            {
-                "Date": pd.to_datetime(date_str),
-                "Open": pd.to_numeric(values.get("1. open"), errors="coerce"),
-                "High": pd.to_numeric(values.get("2. high"), errors="coerce"),
-                "Low": pd.to_numeric(values.get("3. low"), errors="coerce"),
-                "Close": pd.to_numeric(values.get("5. adjusted close"), errors="coerce"),
-                "Volume": pd.to_numeric(values.get("6. volume"), errors="coerce"),
-            }
-        )
+    rows = series.values()
+    df = pd.DataFrame(
+        {
+            name: pd.to_numeric([values.get(field) for values in rows], errors="coerce")
+            for field, name in _ALPHA_VANTAGE_COLUMNS.items()
+        },
+        index=pd.to_datetime(list(series), format="%Y-%m-%d"),
+    )
+    df.index.name = "Date"
+
+    df = df.sort_index().dropna(subset=["Close"])
+    dtypes = {"Close": "float32"}
+    volume = df["Volume"]
+    if pd.api.types.is_integer_dtype(volume) and (volume.empty or volume.max() <= _INT32_MAX):
+        dtypes["Volume"] = "int32"
+    return df.astype(dtypes)
 
-    df = pd.DataFrame(rows)
-    if df.empty:
-        return None
 
-    return df.set_index("Date").sort_index().dropna(subset=["Close"])
+@lru_cache(maxsize=16)
+def _normalize_period(period: str) -> str:
+    normalized = period.strip().lower()
+    return normalized if normalized in _PERIOD_TO_DAYS else "6m"
 
 
 def _filter_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
@@ -66,7 +129,7 @@ def _filter_period(df: pd.DataFrame, period: str) -> pd.DataFrame:
     return df[df.index >= cutoff]
 
 
-@st.cache_data(ttl=900)
+@st.cache_data(ttl=900, show_spinner=False)
 def get_data(symbol: str, period: str) -> Optional[pd.DataFrame]:
     """Busca dados históricos da Alpha Vantage sem quebrar o app em caso de erro."""
     try:
@@ -78,9 +141,7 @@ def get_data(symbol: str, period: str) -> Optional[pd.DataFrame]:
         if not clean_symbol:
             return None
 
-        normalized_period = period.strip().lower()
-        if normalized_period not in _PERIOD_TO_DAYS:
-            normalized_period = "6m"
+        normalized_period = _normalize_period(period)
 
         params = {
             "function": "TIME_SERIES_DAILY_ADJUSTED",
@@ -89,13 +150,17 @@ def get_data(symbol: str, period: str) -> Optional[pd.DataFrame]:
             "apikey": API_KEY,
         }
 
-        response = requests.get(ALPHA_VANTAGE_URL, params=params, timeout=20)
-        response.raise_for_status()
-        payload = response.json()
-
-        df = _parse_alpha_vantage_series(payload)
+        cache_path = _disk_cache_path(clean_symbol, params["outputsize"])
+        df = _read_disk_cache(cache_path)
         if df is None:
-            return None
+            response = _http_session().get(ALPHA_VANTAGE_URL, params=params, timeout=20)
+            response.raise_for_status()
+            payload = response.json()
+
+            df = _parse_alpha_vantage_series(payload)
+            if df is None:
+                return None
+            _write_disk_cache(cache_path, df)
 
         filtered = _filter_period(df, normalized_period)
         if filtered.empty:
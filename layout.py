@@ -13,28 +13,45 @@ PERIOD_OPTIONS = {
     "1y": "1 ano",
     "5y": "5 anos",
 }
+_PERIOD_KEYS = tuple(PERIOD_OPTIONS)
+_DEFAULT_TICKERS = ("PETR4.SA", "VALE3.SA", "AAPL", "MSFT")
+_TICKER_EXAMPLES = f"Exemplos: {', '.join(_DEFAULT_TICKERS)}"
+
+# Acima deste número de pregões, o volume é desenhado em WebGL em vez de barras SVG.
+VOLUME_WEBGL_THRESHOLD = 1000
+
+
+_CUSTOM_CSS = """
+<style>
+    .main { background: #f7f9fc; }
+    .block-container { padding-top: 1.3rem; }
+    [data-testid="stSidebar"] { background: #ffffff; border-right: 1px solid #e5e7eb; }
+    .title { font-size: 2rem; font-weight: 700; margin-bottom: 0.2rem; }
+    .subtitle { color: #475569; margin-bottom: 1rem; }
+    .kpi-row {
+        display: grid;
+        grid-template-columns: repeat(4, minmax(0, 1fr));
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
+    .kpi-card {
+        border: 1px solid #e2e8f0;
+        border-radius: 12px;
+        padding: 0.7rem;
+        background: #ffffff;
+        box-shadow: 0 1px 2px rgba(15, 23, 42, 0.04);
+    }
+    .kpi-label { color: #475569; font-size: 0.875rem; }
+    .kpi-value { color: #0f172a; font-size: 1.75rem; font-weight: 600; }
+    @media (max-width: 640px) {
+        .kpi-row { grid-template-columns: repeat(2, minmax(0, 1fr)); }
+    }
+</style>
+"""
 
 
 def apply_custom_style() -> None:
-    st.markdown(
-        """
-        <style>
-            .main { background: #f7f9fc; }
-            .block-container { padding-top: 1.3rem; }
-            [data-testid="stSidebar"] { background: #ffffff; border-right: 1px solid #e5e7eb; }
-            .title { font-size: 2rem; font-weight: 700; margin-bottom: 0.2rem; }
-            .subtitle { color: #475569; margin-bottom: 1rem; }
-            .kpi-row [data-testid="stMetric"] {
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                padding: 0.7rem;
-                background: #ffffff;
-                box-shadow: 0 1px 2px rgba(15, 23, 42, 0.04);
-            }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
 
 
 def render_header() -> None:
@@ -47,31 +64,31 @@ def render_header() -> None:
 
 def render_sidebar() -> tuple[str, str]:
     st.sidebar.header("Configurações")
-    ticker = st.sidebar.text_input("Ticker", value="PETR4.SA").strip().upper()
-    period = st.sidebar.selectbox("Período", options=list(PERIOD_OPTIONS.keys()), format_func=lambda p: PERIOD_OPTIONS[p], index=2)
-    st.sidebar.caption("Exemplos: PETR4.SA, VALE3.SA, AAPL, MSFT")
+    ticker = st.sidebar.text_input("Ticker", value=_DEFAULT_TICKERS[0]).strip().upper()
+    period = st.sidebar.selectbox("Período", options=_PERIOD_KEYS, format_func=PERIOD_OPTIONS.__getitem__, index=2)
+    st.sidebar.caption(_TICKER_EXAMPLES)
     return ticker, period
 
 
 def _format_pct(value: Optional[float]) -> str:
-    if value is None or pd.isna(value):
+    if value is None or value != value:
         return "N/A"
     return f"{value:.2f}%"
 
 
 def render_kpis(metrics: Dict[str, Optional[float]]) -> None:
-    st.markdown('<div class="kpi-row">', unsafe_allow_html=True)
-    c1, c2, c3, c4 = st.columns(4)
-    with c1:
-        st.metric("Retorno", _format_pct(metrics.get("return_accumulated")))
-    with c2:
-        st.metric("Volatilidade", _format_pct(metrics.get("volatility_annualized")))
-    with c3:
-        sharpe = metrics.get("sharpe")
-        st.metric("Sharpe", f"{sharpe:.2f}" if sharpe is not None else "N/A")
-    with c4:
-        st.metric("Drawdown", _format_pct(metrics.get("max_drawdown")))
-    st.markdown("</div>", unsafe_allow_html=True)
+    sharpe = metrics.get("sharpe")
+    cards = (
+        ("Retorno", _format_pct(metrics.get("return_accumulated"))),
+        ("Volatilidade", _format_pct(metrics.get("volatility_annualized"))),
+        ("Sharpe", f"{sharpe:.2f}" if sharpe is not None else "N/A"),
+        ("Drawdown", _format_pct(metrics.get("max_drawdown"))),
+    )
+    html = "".join(
+        f'<div class="kpi-card"><div class="kpi-label">{label}</div><div class="kpi-value">{value}</div></div>'
+        for label, value in cards
+    )
+    st.markdown(f'<div class="kpi-row">{html}</div>', unsafe_allow_html=True)
 
 
 def render_friendly_error(message: str) -> None:
@@ -82,12 +99,13 @@ def render_friendly_error(message: str) -> None:
     )
 
 
-def build_price_chart(history: pd.DataFrame, symbol: str) -> go.Figure:
+@st.cache_data(ttl=900, show_spinner=False)
+def build_price_chart(history: pd.DataFrame, symbol: str, period: str = "") -> go.Figure:
     fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
-            x=history.index,
-            y=history["Close"],
+        go.Scattergl(
+            x=history.index.to_numpy(),
+            y=history["Close"].to_numpy(),
             mode="lines",
             name=symbol,
             line=dict(color="#2563eb", width=2.5),
@@ -99,23 +117,34 @@ def build_price_chart(history: pd.DataFrame, symbol: str) -> go.Figure:
         height=450,
         margin=dict(l=8, r=8, t=42, b=8),
         hovermode="x unified",
+        uirevision=f"{symbol}:{period}",
     )
     fig.update_xaxes(showgrid=True, gridcolor="#e2e8f0")
     fig.update_yaxes(showgrid=True, gridcolor="#e2e8f0")
     return fig
 
 
+@st.cache_data(ttl=900, show_spinner=False)
 def build_volume_chart(history: pd.DataFrame) -> go.Figure:
-    fig = go.Figure(
-        data=[
-            go.Bar(
-                x=history.index,
-                y=history["Volume"],
-                marker_color="#93c5fd",
-                name="Volume",
-            )
-        ]
-    )
+    x = history.index.to_numpy()
+    y = history["Volume"].to_numpy()
+    if len(history) > VOLUME_WEBGL_THRESHOLD:
+        trace = go.Scattergl(
+            x=x,
+            y=y,
+            mode="lines",
+            line=dict(color="#93c5fd", shape="hv"),
+            name="Volume",
+        )
+    else:
+        trace = go.Bar(
+            x=x,
+            y=y,
+            marker_color="#93c5fd",
+            name="Volume",
+        )
+
+    fig = go.Figure(data=[trace])
     fig.update_layout(
         title="Volume diário",
         template="plotly_white",
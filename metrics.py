@@ -1,10 +1,24 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import streamlit as st
+
+from _metrics_njit import NUMBA_DISPONIVEL, estatisticas_retornos
 
 TRADING_DAYS_PER_YEAR = 252
+_SQRT_TDY = TRADING_DAYS_PER_YEAR**0.5
+
+# Nome e fator de escala de cada métrica no dicionário exposto por ``calculate_metrics``.
+_METRICAS_EXPOSTAS = {
+    "retorno_acumulado": ("return_accumulated", 100),
+    "cagr": ("cagr", 100),
+    "volatilidade_anualizada": ("volatility_annualized", 100),
+    "sharpe_ratio": ("sharpe", 1),
+    "maximo_drawdown": ("max_drawdown", 100),
+}
 
 
 def _empty_metrics() -> Dict[str, Optional[float]]:
@@ -17,66 +31,102 @@ def _empty_metrics() -> Dict[str, Optional[float]]:
     }
 
 
-def calcular_metricas(df: pd.DataFrame) -> Dict[str, Optional[float]]:
-    """Calcula métricas de performance a partir da série de preços de fechamento.
+def _estatisticas_retornos(close: np.ndarray) -> Tuple[float, float, float]:
+    """Retorna média, desvio padrão e máximo drawdown (exige ao menos dois fechamentos)."""
+    if NUMBA_DISPONIVEL:
+        return estatisticas_retornos(close)
 
-    Espera-se um DataFrame com coluna ``Close`` ordenada cronologicamente.
-    """
-    if df.empty or "Close" not in df.columns:
-        return _empty_metrics()
+    retornos = np.diff(close)
+    retornos /= close[:-1]
+    desvio = retornos.std(ddof=1) if retornos.size > 1 else np.nan
+    crescimento = close[1:] / close[0]
+    pico = np.maximum.accumulate(crescimento)
+    np.divide(crescimento, pico, out=pico)
+    return retornos.mean(), desvio, pico.min() - 1.0
 
-    close = df["Close"].dropna()
-    if close.empty:
-        return _empty_metrics()
 
-    retornos_diarios = close.pct_change().dropna()
+def _preparar_fechamento(
+    df: pd.DataFrame,
+) -> Tuple[np.ndarray, Optional[Tuple[pd.Timestamp, pd.Timestamp]]]:
+    """Extrai os fechamentos válidos em ``float64`` e as datas do primeiro e do último."""
+    if df.empty or "Close" not in df.columns:
+        return np.empty(0, dtype=np.float64), None
+
+    valores = df["Close"].to_numpy(dtype=np.float64)
+    nulos = np.isnan(valores)
+    if not nulos.any():
+        if not isinstance(df.index, pd.DatetimeIndex):
+            return valores, None
+        return valores, (df.index[0], df.index[-1])
+
+    validos = ~nulos
+    close = valores[validos]
+    if close.size == 0 or not isinstance(df.index, pd.DatetimeIndex):
+        return close, None
+
+    inicio = int(validos.argmax())
+    fim = validos.size - 1 - int(validos[::-1].argmax())
+    return close, (df.index[inicio], df.index[fim])
+
+
+def _metricas_do_fechamento(
+    close: np.ndarray, periodo: Optional[Tuple[pd.Timestamp, pd.Timestamp]]
+) -> Dict[str, Optional[float]]:
+    """Calcula as métricas a partir dos fechamentos já extraídos por ``_preparar_fechamento``."""
+    if close.size < 2:
+        metricas = _empty_metrics()
+        if close.size == 1:
+            metricas.update(retorno_acumulado=0.0, cagr=0.0)
+        return metricas
+
+    n_retornos = close.size - 1
+    media, desvio, maximo_drawdown = _estatisticas_retornos(close)
 
     retorno_acumulado = 0.0
     cagr = 0.0
-    if len(close) > 1 and close.iloc[0] > 0:
-        retorno_acumulado = (close.iloc[-1] / close.iloc[0]) - 1
-        if isinstance(close.index, pd.DatetimeIndex) and len(close.index) > 1:
-            dias = (close.index[-1] - close.index[0]).days
-            anos = dias / 365.25
+    if close[0] > 0:
+        razao = close[-1] / close[0]
+        retorno_acumulado = razao - 1
+        if periodo is not None:
+            anos = (periodo[1] - periodo[0]).days / 365.25
         else:
-            anos = len(retornos_diarios) / TRADING_DAYS_PER_YEAR
+            anos = n_retornos / TRADING_DAYS_PER_YEAR
 
         if anos > 0:
-            cagr = (close.iloc[-1] / close.iloc[0]) ** (1 / anos) - 1
+            cagr = np.expm1(np.log1p(retorno_acumulado) / anos) if razao > 0 else -1.0
 
     volatilidade_anualizada = None
     sharpe_ratio = None
-    if not retornos_diarios.empty:
-        desvio = retornos_diarios.std(ddof=1)
-        if pd.notna(desvio):
-            volatilidade_anualizada = desvio * (TRADING_DAYS_PER_YEAR**0.5)
-            if desvio > 0:
-                sharpe_ratio = (retornos_diarios.mean() / desvio) * (TRADING_DAYS_PER_YEAR**0.5)
-
-    crescimento = (1 + retornos_diarios).cumprod()
-    pico = crescimento.cummax()
-    drawdown = (crescimento / pico) - 1
-    maximo_drawdown = drawdown.min() if not drawdown.empty else None
+    if n_retornos > 1 and desvio == desvio:
+        volatilidade_anualizada = float(desvio) * _SQRT_TDY
+        if desvio > 0:
+            sharpe_ratio = float(media / desvio) * _SQRT_TDY
 
     return {
         "retorno_acumulado": retorno_acumulado,
         "cagr": cagr,
         "volatilidade_anualizada": volatilidade_anualizada,
         "sharpe_ratio": sharpe_ratio,
-        "maximo_drawdown": maximo_drawdown,
+        "maximo_drawdown": float(maximo_drawdown),
     }
 
 
+def calcular_metricas(df: pd.DataFrame) -> Dict[str, Optional[float]]:
+    """Calcula métricas de performance a partir da série de preços de fechamento.
+
+    Espera-se um DataFrame com coluna ``Close`` ordenada cronologicamente.
+    """
+    return _metricas_do_fechamento(*_preparar_fechamento(df))
+
+
+@st.cache_data(ttl=900, show_spinner=False)
 def calculate_metrics(history: pd.DataFrame) -> Dict[str, Optional[float]]:
     """Wrapper de compatibilidade para o restante da aplicação."""
-    metricas = calcular_metricas(history)
-    return {
-        "return_accumulated": None if metricas["retorno_acumulado"] is None else metricas["retorno_acumulado"] * 100,
-        "cagr": None if metricas["cagr"] is None else metricas["cagr"] * 100,
-        "volatility_annualized": None
-        if metricas["volatilidade_anualizada"] is None
-        else metricas["volatilidade_anualizada"] * 100,
-        "sharpe": metricas["sharpe_ratio"],
-        "max_drawdown": None if metricas["maximo_drawdown"] is None else metricas["maximo_drawdown"] * 100,
-        "last_close": history["Close"].dropna().iloc[-1] if not history.empty and "Close" in history.columns and not history["Close"].dropna().empty else None,
+    close, periodo = _preparar_fechamento(history)
+    metricas = _metricas_do_fechamento(close, periodo)
+    resultado = {
+        nome: None if metricas[chave] is None else metricas[chave] * escala
+        for chave, (nome, escala) in _METRICAS_EXPOSTAS.items()
     }
+    resultado["last_close"] = float(close[-1]) if close.size else None
+    return resultado